@@ -1,33 +1,29 @@
 # custom_profit_calculation_script.py
+import numpy as np
 
-def calculate_net_profit(trade_history, fee_percent):
+# Сторона сделки в массиве sides
+BUY = 0
+SELL = 1
+
+
+def calculate_net_profit(sides, amounts, fee_percent):
     """
     Расчет чистой прибыли с учетом комиссии.
-    :param trade_history: Список сделок.
+    :param sides: Массив (np.int8) сторон сделок (BUY или SELL).
+    :param amounts: Массив (np.float64) сумм сделок: стоимость для покупок, выручка для продаж.
     :param fee_percent: Комиссия биржи.
     :return: Чистая прибыль.
     """
-    net_profit = 0
-
-    for trade in trade_history:
-        if trade['type'] == 'buy':
-            # Учитываем комиссию при покупке
-            cost_with_fee = trade['cost'] * (1 + fee_percent)
-            net_profit -= cost_with_fee
-        elif trade['type'] == 'sell':
-            # Учитываем комиссию при продаже
-            revenue_with_fee = trade['revenue'] * (1 - fee_percent)
-            net_profit += revenue_with_fee
+    # Учитываем комиссию при продаже и при покупке
+    return ((1 - fee_percent) * np.where(sides == SELL, amounts, 0)
+            - (1 + fee_percent) * np.where(sides == BUY, amounts, 0)).sum()
 
-    return net_profit
 
 # Пример использования
-trade_history = [
-    {'type': 'buy', 'cost': 1000},
-    {'type': 'sell', 'revenue': 1015},
-]
+sides = np.array([BUY, SELL], dtype=np.int8)
+amounts = np.array([1000, 1015], dtype=np.float64)
 
 fee_percent = 0.002  # 0.2%
 
-net_profit = calculate_net_profit(trade_history, fee_percent)
+net_profit = calculate_net_profit(sides, amounts, fee_percent)
 print(f"Net Profit: {net_profit}")
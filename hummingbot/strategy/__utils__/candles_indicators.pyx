@@ -0,0 +1,51 @@
+# distutils: language=c++
+
+import numpy as np
+from libc.math cimport fabs, NAN
+
+
+def rsi(const double[:] close, int length):
+    """
+    Relative strength index over the close prices, equivalent to pandas_ta rsi. The gains and losses are smoothed
+    with Wilder's moving average (ewm with alpha=1/length, adjust=True and min_periods=length) in a single pass.
+    The ewm weights cancel out in the ratio, so only the weighted sums are tracked.
+    """
+    cdef:
+        Py_ssize_t n = close.shape[0]
+        Py_ssize_t i
+        double decay = 1.0 - 1.0 / length
+        double gain_sum = 0
+        double loss_sum = 0
+        double change
+        double[:] result = np.full(n, NAN)
+
+    for i in range(1, n):
+        change = close[i] - close[i - 1]
+        gain_sum = gain_sum * decay + (change if change > 0 else 0)
+        loss_sum = loss_sum * decay + (-change if change < 0 else 0)
+        if i >= length and gain_sum + loss_sum != 0:
+            result[i] = 100 * gain_sum / (gain_sum + loss_sum)
+    return np.asarray(result)
+
+
+def last_natr(const double[:] high, const double[:] low, const double[:] close, int length):
+    """
+    Last normalized average true range (in percentage), equivalent to pandas_ta natr(...).iloc[-1]. The true range
+    and Wilder's moving average (ewm with alpha=1/length, adjust=True and min_periods=length) are computed in a single
+    pass over scalars, without allocating the intermediate series.
+    """
+    cdef:
+        Py_ssize_t n = close.shape[0]
+        Py_ssize_t i
+        double decay = 1.0 - 1.0 / length
+        double true_range_sum = 0
+        double weights = 0
+        double true_range
+
+    if n <= length:
+        return NAN
+    for i in range(1, n):
+        true_range = max(high[i] - low[i], fabs(high[i] - close[i - 1]), fabs(low[i] - close[i - 1]))
+        true_range_sum = true_range_sum * decay + true_range
+        weights = weights * decay + 1
+    return 100 * true_range_sum / weights / close[n - 1]
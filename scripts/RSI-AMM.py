@@ -2,7 +2,11 @@ import logging
 import os
 from pydantic import Field
 from decimal import Decimal
-from typing import List, Dict
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
 
 from hummingbot.client.config.config_data_types import ClientFieldData, BaseClientModel
 from hummingbot.connector.connector_base import ConnectorBase
@@ -11,10 +15,9 @@ from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.event.events import OrderFilledEvent
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig, CandlesFactory
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
+from hummingbot.strategy.__utils__ import candles_indicators
 from hummingbot.strategy.directional_strategy_base import DirectionalStrategyBase
 
-import pandas_ta as ta
-
 
 class RSIAMMConfig(BaseClientModel):
     script_file_name: str = Field(default_factory=lambda: os.path.basename(__file__))
@@ -54,6 +57,8 @@ class RSIAMM(DirectionalStrategyBase):
 
     create_timestamp = 0
     last_mid_price = None
+    # Seconds during which format_status returns the last status text instead of rebuilding it
+    status_refresh_time = 1.0
 
     @classmethod
     def init_markets(cls, config: RSIAMMConfig):
@@ -68,15 +73,23 @@ class RSIAMM(DirectionalStrategyBase):
         self.exchange = config.exchange
         self.market_data_provider = MarketDataProvider(connectors)
         self.max_records = self.config.natr_period + 10
-        self.market_data_provider.initialize_candles_feed(
-            config=CandlesConfig(connector=self.config.exchange,
-                                 trading_pair=self.config.trading_pair,
-                                 interval=self.config.interval,
-                                 max_records=self.config.max_records)
-        )
+        self.order_amount = Decimal(str(self.config.order_amount))
+        self._side_dispatch = {TradeType.BUY: self.buy, TradeType.SELL: self.sell}
+        # Order candidates reused across ticks, only their price is updated on each proposal
+        self._buy_order = OrderCandidate(trading_pair=self.config.trading_pair, is_maker=True, order_type=OrderType.LIMIT,
+                                         order_side=TradeType.BUY, amount=self.order_amount, price=Decimal("0"))
+        self._sell_order = OrderCandidate(trading_pair=self.config.trading_pair, is_maker=True, order_type=OrderType.LIMIT,
+                                          order_side=TradeType.SELL, amount=self.order_amount, price=Decimal("0"))
+        self._proposal = [self._buy_order, self._sell_order]
+        # (last candle timestamp, rsi value, natr) of the last indicators computation
+        self._ind_cache = (None, None, None)
+        # High, low and close rows of the candles, kept between ticks and passed as views to the indicator kernels
+        self._hlc_buffer = None
+        # (timestamp, status text) of the last format_status call
+        self._status_cache = (None, None)
 
     def on_tick(self):
-        if not self.market_data_provider.ready:
+        if not self.market_data_provider.ready or not self.all_candles_ready:
             return
 
         if self.create_timestamp <= self.current_timestamp:
@@ -89,14 +102,48 @@ class RSIAMM(DirectionalStrategyBase):
             self.place_orders(proposal)
             self.create_timestamp = self.config.order_refresh_time + self.current_timestamp
 
-    def get_rsi_signal(self):
+    def get_indicators(self) -> Tuple[float, float]:
+        """
+        Retrieves the last RSI value and NATR. Both are only recomputed when a new candle arrives, ticks within the
+        same candle reuse the cached values.
+        Returns:
+            Tuple[float, float]: The last RSI value and NATR.
+        """
+        candles = self.candles[0]._candles
+        last_timestamp = float(candles[-1][0])
+        if last_timestamp != self._ind_cache[0]:
+            self.update_candles_buffer(candles)
+            rsi_value = self.get_rsi()[-1]
+            self._ind_cache = (last_timestamp, rsi_value, self.get_natr())
+        return self._ind_cache[1], self._ind_cache[2]
+
+    def update_candles_buffer(self, candles):
+        """
+        Updates the high, low and close buffers passed to the indicator kernels. When a single candle arrived since
+        the last update, the buffers are shifted in place and only the last two candles are written (the previous one
+        kept changing until it closed). Otherwise they are refilled from the candles feed.
+        Args:
+            candles (deque): The candles of the candles feed.
+        """
+        if self._hlc_buffer is not None and self._hlc_buffer.shape[1] == len(candles) and \
+                float(candles[-2][0]) == self._ind_cache[0]:
+            self._hlc_buffer[:, :-1] = self._hlc_buffer[:, 1:]
+            for i in (-2, -1):
+                self._hlc_buffer[:, i] = candles[i][2:5]
+        else:
+            if self._hlc_buffer is None or self._hlc_buffer.shape[1] != len(candles):
+                self._hlc_buffer = np.empty((3, len(candles)), dtype=np.float64)
+            for i, candle in enumerate(candles):
+                self._hlc_buffer[:, i] = candle[2:5]
+
+    def get_rsi_signal(self, rsi_value: float):
         """
         Generates the trading signal based on the RSI indicator.
+        Args:
+            rsi_value (float): The last RSI value.
         Returns:
             int: The trading signal (-1 for sell signal, 0 for netural signal, 1 for buy signal).
         """
-        candles_df = self.get_processed_df()
-        rsi_value = candles_df.iat[-1, -1]
         msg = (f"RSI signal is {rsi_value}")
         self.log_with_clock(logging.INFO, msg)
         if rsi_value > self.config.rsi_high:
@@ -108,61 +155,47 @@ class RSIAMM(DirectionalStrategyBase):
         else:
             return 0
 
-    def get_processed_df(self):
+    def get_rsi(self) -> np.ndarray:
         """
-        Retrieves the processed dataframe with RSI values.
+        Computes the RSI values of the candles in the candles buffer.
         Returns:
-            pd.DataFrame: The processed dataframe with RSI values.
+            np.ndarray: The RSI values, one per candle.
         """
-        candles_df = self.candles[0].candles_df
-        candles_df.ta.rsi(length=7, append=True)
-        return candles_df
+        return candles_indicators.rsi(self._hlc_buffer[2], 7)
 
     def create_proposal(self, mid_price) -> List[OrderCandidate]:
-        natr = self.get_natr()
+        rsi_value, natr = self.get_indicators()
+        # spread math is done in float, prices are converted back to Decimal only once per side
+        spread = self.config.natr_spread_multiplier * natr
 
         # calculate RSI, if signal is 1 then BUY signal, -1 is SELL signal. Shift the MID price accordingly
-        rsi_signal = self.get_rsi_signal()
-        if rsi_signal == 1:
-            adjusted_mid_price = mid_price * Decimal(1 + (self.config.natr_spread_multiplier * natr * self.config.rsi_spread_change))
-        elif rsi_signal == -1:
-            adjusted_mid_price = mid_price * Decimal(1 - (self.config.natr_spread_multiplier * natr * self.config.rsi_spread_change))
-        else:
-            adjusted_mid_price = mid_price
+        rsi_signal = self.get_rsi_signal(rsi_value)
+        adjusted_mid_price = float(mid_price) * (1 + rsi_signal * spread * self.config.rsi_spread_change)
         self.log_with_clock(logging.INFO, f"Adjusted mid price is  {adjusted_mid_price}")
-        buy_price = adjusted_mid_price * Decimal(1 - self.config.natr_spread_multiplier * natr)
-        sell_price = adjusted_mid_price * Decimal(1 + self.config.natr_spread_multiplier * natr)
-
-        buy_order = OrderCandidate(trading_pair=self.config.trading_pair, is_maker=True, order_type=OrderType.LIMIT,
-                                   order_side=TradeType.BUY, amount=Decimal(self.config.order_amount), price=buy_price)
-
-        sell_order = OrderCandidate(trading_pair=self.config.trading_pair, is_maker=True, order_type=OrderType.LIMIT,
-                                    order_side=TradeType.SELL, amount=Decimal(self.config.order_amount), price=sell_price)
-
-        return [buy_order, sell_order]
+        self._buy_order.price = Decimal(repr(adjusted_mid_price * (1 - spread)))
+        self._sell_order.price = Decimal(repr(adjusted_mid_price * (1 + spread)))
+        return self._proposal
 
     def get_natr(self):
-        candles_df = self.market_data_provider.get_candles_df(self.config.exchange, self.config.trading_pair, self.config.interval,
-                                                              self.config.max_records)
-        natr = ta.natr(high=candles_df["high"], low=candles_df["low"], close=candles_df["close"],
-                       length=self.config.natr_period)
-        return natr.iloc[-1] / 100
+        high, low, close = self._hlc_buffer
+        natr = candles_indicators.last_natr(high, low, close, self.config.natr_period)
+        return natr / 100
 
     def place_orders(self, proposal: List[OrderCandidate]) -> None:
         for order in proposal:
             self.place_order(connector_name=self.config.exchange, order=order)
 
     def place_order(self, connector_name: str, order: OrderCandidate):
-        if order.order_side == TradeType.SELL:
-            self.sell(connector_name=connector_name, trading_pair=order.trading_pair, amount=order.amount,
-                      order_type=order.order_type, price=order.price)
-        elif order.order_side == TradeType.BUY:
-            self.buy(connector_name=connector_name, trading_pair=order.trading_pair, amount=order.amount,
-                     order_type=order.order_type, price=order.price)
+        self._side_dispatch[order.order_side](connector_name=connector_name, trading_pair=order.trading_pair,
+                                              amount=order.amount, order_type=order.order_type, price=order.price)
 
     def cancel_all_orders(self):
-        for order in self.get_active_orders(connector_name=self.config.exchange):
-            self.cancel(self.config.exchange, order.trading_pair, order.client_order_id)
+        # Skip orders with a cancel already in flight, and cancel the rest with a single batch request (connectors
+        # without batch cancel support send them one by one)
+        orders_to_cancel = [order for order in self.get_active_orders(connector_name=self.config.exchange)
+                            if self.order_tracker.check_and_track_cancel(order.client_order_id)]
+        if len(orders_to_cancel) > 0:
+            self.connectors[self.config.exchange].batch_order_cancel(orders_to_cancel=orders_to_cancel)
 
     def did_fill_order(self, event: OrderFilledEvent):
         msg = (
@@ -177,35 +210,41 @@ class RSIAMM(DirectionalStrategyBase):
         """
         if not self.ready_to_trade:
             return "Market connectors are not ready."
+        status_timestamp, status = self._status_cache
+        if status_timestamp is not None and self.current_timestamp - status_timestamp < self.status_refresh_time:
+            return status
         lines = []
         warning_lines = []
         warning_lines.extend(self.network_warning(self.get_market_trading_pair_tuples()))
 
         balance_df = self.get_balance_df()
-        lines.extend(["", "  Balances:"] + ["    " + line for line in balance_df.to_string(index=False).split("\n")])
+        lines.extend(["", "  Balances:"] + ["    " + line for line in self.format_df(balance_df).split("\n")])
         market_status_df = self.get_market_status_df_with_depth()
-        lines.extend(["", "  Market Status Data Frame:"] + ["    " + line for line in market_status_df.to_string(index=False).split("\n")])
+        lines.extend(["", "  Market Status Data Frame:"] + ["    " + line for line in self.format_df(market_status_df).split("\n")])
 
         warning_lines.extend(self.balance_warning(self.get_market_trading_pair_tuples()))
         if len(warning_lines) > 0:
             lines.extend(["", "*** WARNINGS ***"] + warning_lines)
-        return "\n".join(lines)
+        status = "\n".join(lines)
+        self._status_cache = (self.current_timestamp, status)
+        return status
+
+    @staticmethod
+    def format_df(df: pd.DataFrame) -> str:
+        return tabulate(df.values, headers=list(df.columns), tablefmt="plain", disable_numparse=True)
 
     def get_market_status_df_with_depth(self):
         market_status_df = self.market_status_data_frame(self.get_market_trading_pair_tuples())
-        market_status_df["Exchange"] = market_status_df.apply(lambda x: self.get_exchange_status_name(x), axis=1)
-        market_status_df["Volume (+1%)"] = market_status_df.apply(lambda x: self.get_volume_for_percentage_from_mid_price(x, 0.01), axis=1)
-        market_status_df["Volume (-1%)"] = market_status_df.apply(lambda x: self.get_volume_for_percentage_from_mid_price(x, -0.01), axis=1)
+        markets = list(zip(market_status_df["Exchange"].values, market_status_df["Market"].values,
+                           market_status_df["Mid Price"].values))
+        market_status_df["Volume (+1%)"] = [self.get_volume_for_percentage_from_mid_price(exchange, market, mid_price, 0.01)
+                                            for exchange, market, mid_price in markets]
+        market_status_df["Volume (-1%)"] = [self.get_volume_for_percentage_from_mid_price(exchange, market, mid_price, -0.01)
+                                            for exchange, market, mid_price in markets]
         return market_status_df
 
-    def get_exchange_status_name(self, row):
-        if row["Exchange"] == "binance":
-            exchange = row["Exchange"]
-        else:
-            exchange = row["Exchange"]
-        return exchange
-    def get_volume_for_percentage_from_mid_price(self, row, percentage):
-        price = row["Mid Price"] * (1 + percentage)
+    def get_volume_for_percentage_from_mid_price(self, exchange, market, mid_price, percentage):
+        price = mid_price * (1 + percentage)
         is_buy = percentage > 0
-        result = self.connectors[row["Exchange"]].get_volume_for_price(row["Market"], is_buy, price)
-        return result.result_volume
\ No newline at end of file
+        result = self.connectors[exchange].get_volume_for_price(market, is_buy, price)
+        return result.result_volume
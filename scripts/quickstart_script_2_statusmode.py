@@ -1,9 +1,12 @@
 import logging
+import math
+from collections import deque
 from decimal import Decimal
 from typing import List
 
+import numpy as np
 import pandas as pd
-import pandas_ta as ta  
+from numpy.lib.stride_tricks import sliding_window_view
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
@@ -22,6 +25,8 @@ class QuickstartScript2(ScriptStrategyBase):
     trading_pair = "POPCAT-USDT"
     exchange = "gate_io_paper_trade"
     price_source = PriceType.MidPrice
+    bb_length = 100
+    bb_std = 2
 
     markets = {exchange: {trading_pair}}
     
@@ -40,6 +45,22 @@ class QuickstartScript2(ScriptStrategyBase):
         self.logger().info("Candles feed started.")
         self.price_ceiling = Decimal("0")
         self.price_floor = Decimal("0")
+        self._side_dispatch = {TradeType.BUY: self.buy, TradeType.SELL: self.sell}
+        # Static configuration converted to Decimal once, from its string form to keep the exact values
+        self._buy_mult = Decimal("1") - Decimal(str(self.bid_spread))
+        self._sell_mult = Decimal("1") + Decimal(str(self.ask_spread))
+        self._order_amount = Decimal(str(self.order_amount))
+        # Order candidates reused across ticks, only their price is updated on each proposal
+        self._buy_order = OrderCandidate(trading_pair=self.trading_pair, is_maker=True, order_type=OrderType.LIMIT,
+                                         order_side=TradeType.BUY, amount=self._order_amount, price=Decimal("0"))
+        self._sell_order = OrderCandidate(trading_pair=self.trading_pair, is_maker=True, order_type=OrderType.LIMIT,
+                                          order_side=TradeType.SELL, amount=self._order_amount, price=Decimal("0"))
+        self._proposal = [self._buy_order, self._sell_order]
+        # Closes of the closed candles inside the bbands window, with their running sum and sum of squares
+        self._bb_closes = deque(maxlen=self.bb_length - 1)
+        self._bb_sum = 0.0
+        self._bb_sumsq = 0.0
+        self._bb_window_ts = None
 
     def on_stop(self):
         self.eth_1m_candles.stop()
@@ -65,16 +86,9 @@ class QuickstartScript2(ScriptStrategyBase):
     def create_proposal(self) -> List[OrderCandidate]:
         try:
             ref_price = self.connectors[self.exchange].get_price_by_type(self.trading_pair, self.price_source)
-            buy_price = ref_price * Decimal(1 - self.bid_spread)
-            sell_price = ref_price * Decimal(1 + self.ask_spread)
-
-            buy_order = OrderCandidate(trading_pair=self.trading_pair, is_maker=True, order_type=OrderType.LIMIT,
-                                       order_side=TradeType.BUY, amount=Decimal(self.order_amount), price=buy_price)
-
-            sell_order = OrderCandidate(trading_pair=self.trading_pair, is_maker=True, order_type=OrderType.LIMIT,
-                                        order_side=TradeType.SELL, amount=Decimal(self.order_amount), price=sell_price)
-
-            return [buy_order, sell_order]
+            self._buy_order.price = ref_price * self._buy_mult
+            self._sell_order.price = ref_price * self._sell_mult
+            return self._proposal
         except Exception as e:
             self.logger().error(f"Error in create_proposal: {str(e)}")
             return []
@@ -96,19 +110,19 @@ class QuickstartScript2(ScriptStrategyBase):
 
     def place_order(self, connector_name: str, order: OrderCandidate):
         try:
-            if order.order_side == TradeType.SELL:
-                self.sell(connector_name=connector_name, trading_pair=order.trading_pair, amount=order.amount,
-                          order_type=order.order_type, price=order.price)
-            elif order.order_side == TradeType.BUY:
-                self.buy(connector_name=connector_name, trading_pair=order.trading_pair, amount=order.amount,
-                         order_type=order.order_type, price=order.price)
+            self._side_dispatch[order.order_side](connector_name=connector_name, trading_pair=order.trading_pair,
+                                                  amount=order.amount, order_type=order.order_type, price=order.price)
         except Exception as e:
             self.logger().error(f"Error in place_order: {str(e)}")
 
     def cancel_all_orders(self):
         try:
-            for order in self.get_active_orders(connector_name=self.exchange):
-                self.cancel(self.exchange, order.trading_pair, order.client_order_id)
+            # Skip orders with a cancel already in flight, and cancel the rest with a single batch request (connectors
+            # without batch cancel support send them one by one)
+            orders_to_cancel = [order for order in self.get_active_orders(connector_name=self.exchange)
+                                if self.order_tracker.check_and_track_cancel(order.client_order_id)]
+            if len(orders_to_cancel) > 0:
+                self.connectors[self.exchange].batch_order_cancel(orders_to_cancel=orders_to_cancel)
         except Exception as e:
             self.logger().error(f"Error in cancel_all_orders: {str(e)}")
 
@@ -139,8 +153,9 @@ class QuickstartScript2(ScriptStrategyBase):
                 lines.extend([
                     "\n############################################ Market Data ############################################\n"])
                 candles_df = self.eth_1m_candles.candles_df
-                # Let's add some technical indicators
-                candles_df.ta.bbands(length=100, std=2, append=True)
+                # The bbands are kept in their own dataframe and only joined to the candles shown
+                bbands_df = self.get_bbands(candles_df["close"].to_numpy(), rows=5)
+                candles_df = pd.concat([candles_df.tail(5).reset_index(drop=True), bbands_df], axis=1)
                 candles_df["timestamp"] = pd.to_datetime(candles_df["timestamp"], unit="ms")
                 lines.extend([f"Candles: {self.eth_1m_candles.name} | Interval: {self.eth_1m_candles.interval}\n"])
                 lines.extend(["    " + line for line in candles_df.tail().to_string(index=False).split("\n")])
@@ -154,23 +169,73 @@ class QuickstartScript2(ScriptStrategyBase):
 
     def apply_price_ceiling_floor_filter(self, proposal):
         try:
-            proposal_filtered = []
-            for order in proposal:
-                if order.order_side == TradeType.SELL and order.price > self.price_floor:
-                    proposal_filtered.append(order)
-                elif order.order_side == TradeType.BUY and order.price < self.price_ceiling:
-                    proposal_filtered.append(order)
-            return proposal_filtered
+            is_sell = np.array([order.order_side == TradeType.SELL for order in proposal], dtype=bool)
+            is_buy = np.array([order.order_side == TradeType.BUY for order in proposal], dtype=bool)
+            prices = np.array([float(order.price) for order in proposal], dtype=np.float64)
+            mask = (is_sell & (prices > float(self.price_floor))) | (is_buy & (prices < float(self.price_ceiling)))
+            return [proposal[i] for i in np.flatnonzero(mask)]
         except Exception as e:
             self.logger().error(f"Error in apply_price_ceiling_floor_filter: {str(e)}")
             return []
 
     def calculate_price_ceiling_floor(self):
         try:
-            candles_df = self.eth_1m_candles.candles_df
-            candles_df.ta.bbands(length=100, std=2, append=True)
-            last_row = candles_df.iloc[-1]
-            self.price_ceiling = last_row['BBU_100_2.0'].item()
-            self.price_floor = last_row['BBL_100_2.0'].item()
+            self.update_bbands_window()
+            # The live candle is the last one of the window, the rest of it is kept in the running sums
+            close = float(self.eth_1m_candles._candles[-1][4])
+            mean = (self._bb_sum + close) / self.bb_length
+            variance = (self._bb_sumsq + close * close) / self.bb_length - mean * mean
+            std = math.sqrt(max(variance, 0.0))
+            self.price_ceiling = mean + self.bb_std * std
+            self.price_floor = mean - self.bb_std * std
         except Exception as e:
-            self.logger().error(f"Error in calculate_price_ceiling_floor: {str(e)}")
\ No newline at end of file
+            self.logger().error(f"Error in calculate_price_ceiling_floor: {str(e)}")
+
+    def update_bbands_window(self):
+        """
+        Rolls the closed candles of the bbands window forward when a new candle arrives. The window is only rebuilt
+        from the candles feed when it can't be rolled by a single candle (first call or missed candles).
+        """
+        candles = self.eth_1m_candles._candles
+        last_timestamp = float(candles[-1][0])
+        if last_timestamp == self._bb_window_ts:
+            return
+        if self._bb_window_ts is not None and float(candles[-2][0]) == self._bb_window_ts:
+            self.add_close_to_bbands_window(float(candles[-2][4]))
+        else:
+            self._bb_closes.clear()
+            self._bb_sum = 0.0
+            self._bb_sumsq = 0.0
+            for i in range(len(candles) - self.bb_length, len(candles) - 1):
+                self.add_close_to_bbands_window(float(candles[i][4]))
+        self._bb_window_ts = last_timestamp
+
+    def add_close_to_bbands_window(self, close: float):
+        if len(self._bb_closes) == self._bb_closes.maxlen:
+            oldest = self._bb_closes[0]
+            self._bb_sum -= oldest
+            self._bb_sumsq -= oldest * oldest
+        self._bb_closes.append(close)
+        self._bb_sum += close
+        self._bb_sumsq += close * close
+
+    def get_bbands(self, close: np.ndarray, rows: int) -> pd.DataFrame:
+        """
+        Returns the bbands (same columns as pandas_ta bbands) of the last rows of the close prices in a separate
+        dataframe. The rolling mean and population std are computed by numpy over sliding windows, only for those rows.
+        """
+        close = close[-(self.bb_length + rows - 1):]
+        windows = sliding_window_view(close, self.bb_length)
+        close = close[self.bb_length - 1:]
+        mid = windows.mean(axis=1)
+        std = windows.std(axis=1)
+        lower = mid - self.bb_std * std
+        upper = mid + self.bb_std * std
+        suffix = f"{self.bb_length}_{float(self.bb_std)}"
+        return pd.DataFrame({
+            f"BBL_{suffix}": lower,
+            f"BBM_{suffix}": mid,
+            f"BBU_{suffix}": upper,
+            f"BBB_{suffix}": 100 * (upper - lower) / mid,
+            f"BBP_{suffix}": (close - lower) / (upper - lower),
+        })
@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.candles_indicators import last_natr, rsi
+
+
+class CandlesIndicatorsTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 3141592653
+    RECORDS = 1000
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+        self.close = pd.Series(100 + np.cumsum(np.random.normal(0, 1, self.RECORDS)))
+        self.high = self.close + np.random.random(self.RECORDS)
+        self.low = self.close - np.random.random(self.RECORDS)
+
+    @staticmethod
+    def rma(series: pd.Series, length: int) -> pd.Series:
+        return series.ewm(alpha=1 / length, min_periods=length).mean()
+
+    def test_rsi(self):
+        change = self.close.diff()
+        gain = self.rma(change.clip(lower=0), 7)
+        loss = self.rma(-change.clip(upper=0), 7)
+        expected = 100 * gain / (gain + loss)
+
+        result = rsi(self.close.to_numpy(), 7)
+
+        self.assertEqual(7, np.isnan(result).sum())
+        np.testing.assert_allclose(expected.to_numpy(), result, equal_nan=True)
+
+    def test_rsi_without_price_changes(self):
+        result = rsi(np.full(20, 100.0), 7)
+
+        self.assertTrue(np.isnan(result).all())
+
+    def test_last_natr(self):
+        prev_close = self.close.shift(1)
+        true_range = pd.concat([self.high - self.low, self.high - prev_close, prev_close - self.low], axis=1).abs().max(axis=1)
+        true_range.iloc[0] = np.nan
+        expected = 100 * self.rma(true_range, 100) / self.close
+
+        result = last_natr(self.high.to_numpy(), self.low.to_numpy(), self.close.to_numpy(), 100)
+
+        self.assertAlmostEqual(expected.iloc[-1], result)
+
+    def test_last_natr_without_enough_records(self):
+        result = last_natr(self.high.to_numpy()[:100], self.low.to_numpy()[:100], self.close.to_numpy()[:100], 100)
+
+        self.assertTrue(np.isnan(result))